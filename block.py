@@ -1,406 +1,637 @@
-"""CSC148 Assignment 2
-
-=== CSC148 Winter 2020 ===
-Department of Computer Science,
-University of Toronto
-
-This code is provided solely for the personal and private use of
-students taking the CSC148 course at the University of Toronto.
-Copying for purposes other than this use is expressly prohibited.
-All forms of distribution of this code, whether as given or with
-any changes, are expressly prohibited.
-
-Authors: Diane Horton, David Liu, Mario Badr, Sophia Huynh, Misha Schwartz,
-and Jaisie Sin
-
-All of the files in this directory and all subdirectories are:
-Copyright (c) Diane Horton, David Liu, Mario Badr, Sophia Huynh,
-Misha Schwartz, and Jaisie Sin
-
-=== Module Description ===
-
-This file contains the Block class, the main data structure used in the game.
-"""
-from __future__ import annotations
-from typing import Optional, Tuple, List
-import random
-import math
-
-from settings import colour_name, COLOUR_LIST
-
-
-def generate_board(max_depth: int, size: int) -> Block:
-    """Return a new game board with a depth of <max_depth> and dimensions of
-    <size> by <size>.
-
-    >>> board = generate_board(3, 750)
-    >>> board.max_depth
-    3
-    >>> board.size
-    750
-    >>> len(board.children) == 4
-    True
-    """
-    board = Block((0, 0), size, random.choice(COLOUR_LIST), 0, max_depth)
-    board.smash()
-
-    return board
-
-
-class Block:
-    """A square Block in the Blocky game, represented as a tree.
-
-    In addition to its tree-related attributes, a Block also contains attributes
-    that describe how the Block appears on a Cartesian plane. All positions
-    describe the upper left corner (x, y), and the origin is at (0, 0). All
-    positions and sizes are in the unit of pixels.
-
-    When a block has four children, the order of its children impacts each
-    child's position. Indices 0, 1, 2, and 3 are the upper-right child,
-    upper-left child, lower-left child, and lower-right child, respectively.
-
-    === Public Attributes ===
-    position:
-        The (x, y) coordinates of the upper left corner of this Block.
-    size:
-        The height and width of this square Block.
-    colour:
-        If this block is not subdivided, <colour> stores its colour. Otherwise,
-        <colour> is None.
-    level:
-        The level of this block within the overall block structure.
-        The outermost block, corresponding to the root of the tree,
-        is at level zero. If a block is at level i, its children are at
-        level i+1.
-    max_depth:
-        The deepest level allowed in the overall block structure.
-    children:
-        The blocks into which this block is subdivided. The children are
-        stored in this order: upper-right child, upper-left child,
-        lower-left child, lower-right child.
-
-    === Representation Invariants===
-    - len(children) == 0 or len(children) == 4
-    - If this Block has children:
-        - their max_depth is the same as that of this Block.
-        - their size is half that of this Block.
-        - their level is one greater than that of this Block.
-        - their position is determined by the position and size of this Block,
-          and their index in this Block's list of children.
-        - this Block's colour is None.
-    - If this Block has no children:
-        - its colour is not None.
-    - level <= max_depth
-    """
-    position: Tuple[int, int]
-    size: int
-    colour: Optional[Tuple[int, int, int]]
-    level: int
-    max_depth: int
-    children: List[Block]
-
-    def __init__(self, position: Tuple[int, int], size: int,
-                 colour: Optional[Tuple[int, int, int]], level: int,
-                 max_depth: int) -> None:
-        """Initialize this block with <position>, dimensions <size> by <size>,
-        the given <colour>, at <level>, and with no children.
-
-        Preconditions:
-            - position[0] >= 0 and position[1] >= 0
-            - size > 0
-            - level >= 0
-            - max_depth >= level
-        """
-        self.position = position
-        self.size = size
-        self.colour = colour
-        self.level = level
-        self.max_depth = max_depth
-        self.children = []
-
-    def __str__(self) -> str:
-        """Return this Block in a string format.
-
-        >>> block = Block((0, 0), 750, (0, 0, 0), 0, 1)
-        >>> str(block)
-        'Leaf: colour=Black, pos=(0, 0), size=750, level=0\\n'
-        """
-        if len(self.children) == 0:
-            indents = '\t' * self.level
-            colour = colour_name(self.colour)
-            return f'{indents}Leaf: colour={colour}, pos={self.position}, ' \
-                   f'size={self.size}, level={self.level}\n'
-        else:
-            indents = '\t' * self.level
-            result = f'{indents}Parent: pos={self.position},' \
-                     f'size={self.size}, level={self.level}\n'
-
-            for child in self.children:
-                result += str(child)
-
-            return result
-
-    def __eq__(self, other: Block) -> bool:
-        """Return True iff this Block and all its descendents are equivalent to
-        the <other> Block and all its descendents.
-        """
-        if len(self.children) == 0 and len(other.children) == 0:
-            # Both self and other are leaves.
-            return self.position == other.position and \
-                   self.size == other.size and \
-                   self.colour == other.colour and \
-                   self.level == other.level and \
-                   self.max_depth == other.max_depth
-        elif len(self.children) != len(other.children):
-            # One of self or other is a leaf while the other is not.
-            return False
-        else:
-            # Both self and other have four children.
-            for i in range(4):
-                # The != operator also uses the __eq__ special method.
-                if self.children[i] != other.children[i]:
-                    return False
-
-            return True
-
-    def _child_size(self) -> int:
-        """Return the size of this Block's children.
-        """
-        return round(self.size / 2.0)
-
-    def _children_positions(self) -> List[Tuple[int, int]]:
-        """Return the positions of this Block's four children.
-
-        The positions are returned in this order: upper-right child, upper-left
-        child, lower-left child, lower-right child.
-        """
-        x = self.position[0]
-        y = self.position[1]
-        size = self._child_size()
-
-        return [(x + size, y), (x, y), (x, y + size), (x + size, y + size)]
-
-    def _update_children_positions(self, position: Tuple[int, int]) -> None:
-        """Set the position of this Block to <position> and update all its
-        descendants to have positions consistent with this Block's.
-
-        <position> is the (x, y) coordinates of the upper-left corner of this
-        Block.
-        """
-        self.position = position
-
-        if len(self.children) == 4:
-            pos = self._children_positions()
-            for i in range(4):
-                self.children[i].position = pos[i]
-            for child in self.children:
-                if child.colour is None:
-                    child._update_children_positions(child.position)
-
-    def smashable(self) -> bool:
-        """Return True iff this block can be smashed.
-
-        A block can be smashed if it has no children and its level is not at
-        max_depth.
-        """
-        return self.level != self.max_depth and len(self.children) == 0
-
-    def _pick_color(self) -> None:
-        """
-        A private helper method for [smash].
-        Randomly pick a colour from the COLOUR_LIST in the settings.
-        """
-        random_int = random.randint(0, len(COLOUR_LIST) - 1)
-        colour = COLOUR_LIST[random_int]
-        self.colour = colour
-
-    def smash(self) -> bool:
-        """Sub-divide this block so that it has four randomly generated
-        children.
-
-        If this Block's level is <max_depth>, do nothing. If this block has
-        children, do nothing.
-
-        Return True iff the smash was performed.
-        """
-        if not self.smashable():
-            return False
-        self.colour = None
-        pos_lst = self._children_positions()
-        child_size = self._child_size()
-        child_level = self.level + 1
-        max_depth = self.max_depth
-        # common attributes for children. Only colours are different.
-        # use different random number to generate children
-        for i in range(4):
-            num = random.random()
-            colour = None
-            child = Block(pos_lst[i], child_size, colour, child_level,
-                          max_depth)
-            if num < math.exp(-0.25 * self.level):
-                if not child.smash():
-                    child._pick_color()
-            else:
-                child._pick_color()
-            self.children.append(child)
-        return True
-
-    def swap(self, direction: int) -> bool:
-        """Swap the child Blocks of this Block.
-
-        If this Block has no children, do nothing. Otherwise, if <direction> is
-        1, swap vertically. If <direction> is 0, swap horizontally.
-
-        Return True iff the swap was performed.
-
-        Precondition: <direction> is either 0 or 1
-        """
-        """if len(self.children) == 0:
-            return False
-        if direction == 0:
-            self.children[0], self.children[1] = self.children[1], \
-                                                 self.children[0]
-            self.children[2], self.children[3] = self.children[3], \
-                                                 self.children[2]
-        elif direction == 1:
-            self.children[0], self.children[3] = self.children[3], \
-                                                 self.children[0]
-            self.children[1], self.children[2] = self.children[2],\
-                                                 self.children[1]
-        self._update_children_positions(self.position)
-        return True
-        """
-
-        if len(self.children) == 0:
-            return False
-        pos = self._children_positions()
-        if direction == 1:
-            for i in range(4):
-                self.children[i]._update_children_positions(pos[3 - i])
-            self.children.reverse()
-        else:
-            copy = self.children[:]
-            for i in [0, 2]:  # i = 0 or i = 2
-                self.children[i]._update_children_positions(pos[i + 1])
-            self.children[0], self.children[2] = copy[1], copy[3]
-            for j in [1, 3]:  # i = 1 or i = 3
-                self.children[j]._update_children_positions(pos[j - 1])
-            self.children[1], self.children[3] = copy[0], copy[2]
-        return True
-
-    def rotate(self, direction: int) -> bool:
-        """Rotate this Block and all its descendants.
-
-        If this Block has no children, do nothing. If <direction> is 1, rotate
-        clockwise. If <direction> is 3, rotate counter-clockwise.
-
-        Return True iff the rotate was performed.
-
-        Precondition: <direction> is either 1 or 3.
-        """
-        if len(self.children) == 0:
-            return False
-        if direction == 1:
-            pos = self._children_positions()
-            pos.insert(0, pos.pop())  # [0,1,2,3] -> [3,0,1,2]
-            for i in range(4):
-                self.children[i]._update_children_positions(pos[i])
-                self.children[i].rotate(1)
-            self.children.append(self.children.pop(0))
-            return True
-        else:
-            pos = self._children_positions()
-            pos.append(pos.pop(0))
-            for j in range(4):
-                self.children[j]._update_children_positions(pos[j])
-                self.children[j].rotate(3)
-            self.children.insert(0, self.children.pop())
-            return True
-
-    def paint(self, colour: Tuple[int, int, int]) -> bool:
-        """Change this Block's colour iff it is a leaf at a level of max_depth
-        and its colour is different from <colour>.
-
-        Return True iff this Block's colour was changed.
-        """
-        if self.colour != colour and self.level == self.max_depth and \
-                len(self.children) == 0:
-            self.colour = colour
-            return True
-        else:
-            return False
-
-    def combine(self) -> bool:
-        """Turn this Block into a leaf based on the majority colour of its
-        children.
-
-        The majority colour is the colour with the most child blocks of that
-        colour. A tie does not constitute a majority (e.g., if there are two red
-        children and two blue children, then there is no majority colour).
-
-        If there is no majority colour, do nothing. If this block is not at a
-        level of max_depth - 1, or this block has no children, do nothing.
-
-        Return True iff this Block was turned into a leaf node.
-        """
-        if self.level != self.max_depth - 1 or len(self.children) == 0:
-            return False
-        color_count = {}
-        for child in self.children:
-            colour = child.colour
-            if colour not in color_count:
-                color_count[colour] = 1
-            else:
-                color_count[colour] += 1
-        count = list(color_count.values())
-        colors = list(color_count.keys())
-        max_ = max(count)
-        if count.count(max_) != 1:
-            return False
-        else:
-            self.children = []
-            index = count.index(max_)
-            self.colour = colors[index]
-            return True
-
-    def create_copy(self) -> Block:
-        """Return a new Block that is a deep copy of this Block.
-
-        Remember that a deep copy has new blocks (not aliases) at every level.
-        """
-        colour = self.colour
-        level = self.level
-        max_depth = self.max_depth
-        size = self.size
-        position = self.position
-        if not self.children:  # the block is a leaf
-            return Block(position, size, colour, level, max_depth)
-        else:
-            children = self.children[:]
-            block = Block(position, size, colour, level, max_depth)
-            for child in children:
-                block.children.append(child.create_copy())
-            return block
-
-
-if __name__ == '__main__':
-    import python_ta
-
-    python_ta.check_all(config={
-        'allowed-import-modules': [
-            'doctest', 'python_ta', 'random', 'typing', '__future__', 'math',
-            'settings'
-        ],
-        'max-attributes': 15,
-        'max-args': 6
-    })
-
-    # This is a board consisting of only one block.
-    b1 = Block((0, 0), 750, COLOUR_LIST[0], 0, 1)
-    print("=== tiny board ===")
-    print(b1)
-
-    # Now let's make a random board.
-    b2 = generate_board(3, 750)
-    print("\n=== random board ===")
-    print(b2)
+"""CSC148 Assignment 2
+
+=== CSC148 Winter 2020 ===
+Department of Computer Science,
+University of Toronto
+
+This code is provided solely for the personal and private use of
+students taking the CSC148 course at the University of Toronto.
+Copying for purposes other than this use is expressly prohibited.
+All forms of distribution of this code, whether as given or with
+any changes, are expressly prohibited.
+
+Authors: Diane Horton, David Liu, Mario Badr, Sophia Huynh, Misha Schwartz,
+and Jaisie Sin
+
+All of the files in this directory and all subdirectories are:
+Copyright (c) Diane Horton, David Liu, Mario Badr, Sophia Huynh,
+Misha Schwartz, and Jaisie Sin
+
+=== Module Description ===
+
+This file contains the Block class, the main data structure used in the game.
+"""
+from __future__ import annotations
+from typing import Dict, Optional, Tuple, List
+import random
+import math
+
+from settings import colour_name, COLOUR_LIST
+
+
+def generate_board(max_depth: int, size: int) -> Block:
+    """Return a new game board with a depth of <max_depth> and dimensions of
+    <size> by <size>.
+
+    >>> board = generate_board(3, 750)
+    >>> board.max_depth
+    3
+    >>> board.size
+    750
+    >>> len(board.children) == 4
+    True
+    """
+    board = Block((0, 0), size, random.choice(COLOUR_LIST), 0, max_depth)
+    board.smash()
+
+    return board
+
+
+class Block:
+    """A square Block in the Blocky game, represented as a tree.
+
+    In addition to its tree-related attributes, a Block also contains attributes
+    that describe how the Block appears on a Cartesian plane. All positions
+    describe the upper left corner (x, y), and the origin is at (0, 0). All
+    positions and sizes are in the unit of pixels.
+
+    When a block has four children, the order of its children impacts each
+    child's position. Indices 0, 1, 2, and 3 are the upper-right child,
+    upper-left child, lower-left child, and lower-right child, respectively.
+
+    === Public Attributes ===
+    position:
+        The (x, y) coordinates of the upper left corner of this Block.
+    size:
+        The height and width of this square Block.
+    colour:
+        If this block is not subdivided, <colour> stores its colour. Otherwise,
+        <colour> is None.
+    level:
+        The level of this block within the overall block structure.
+        The outermost block, corresponding to the root of the tree,
+        is at level zero. If a block is at level i, its children are at
+        level i+1.
+    max_depth:
+        The deepest level allowed in the overall block structure.
+    children:
+        The blocks into which this block is subdivided. The children are
+        stored in this order: upper-right child, upper-left child,
+        lower-left child, lower-right child.
+
+    === Representation Invariants===
+    - len(children) == 0 or len(children) == 4
+    - If this Block has children:
+        - their max_depth is the same as that of this Block.
+        - their size is half that of this Block.
+        - their level is one greater than that of this Block.
+        - their position is determined by the position and size of this Block,
+          and their index in this Block's list of children.
+        - this Block's colour is None.
+    - If this Block has no children:
+        - its colour is not None.
+    - level <= max_depth
+    """
+    position: Tuple[int, int]
+    size: int
+    colour: Optional[Tuple[int, int, int]]
+    level: int
+    max_depth: int
+    children: List[Block]
+    # === Private Attributes ===
+    # _registry:
+    #   The registry of the blocks in the board this block belongs to, or None
+    #   if no registry has been built for that board.
+    _registry: Optional[NodeRegistry]
+
+    def __init__(self, position: Tuple[int, int], size: int,
+                 colour: Optional[Tuple[int, int, int]], level: int,
+                 max_depth: int) -> None:
+        """Initialize this block with <position>, dimensions <size> by <size>,
+        the given <colour>, at <level>, and with no children.
+
+        Preconditions:
+            - position[0] >= 0 and position[1] >= 0
+            - size > 0
+            - level >= 0
+            - max_depth >= level
+        """
+        self.position = position
+        self.size = size
+        self.colour = colour
+        self.level = level
+        self.max_depth = max_depth
+        self.children = []
+        self._registry = None
+
+    def __str__(self) -> str:
+        """Return this Block in a string format.
+
+        >>> block = Block((0, 0), 750, (0, 0, 0), 0, 1)
+        >>> str(block)
+        'Leaf: colour=Black, pos=(0, 0), size=750, level=0\\n'
+        """
+        if len(self.children) == 0:
+            indents = '\t' * self.level
+            colour = colour_name(self.colour)
+            return f'{indents}Leaf: colour={colour}, pos={self.position}, ' \
+                   f'size={self.size}, level={self.level}\n'
+        else:
+            indents = '\t' * self.level
+            result = f'{indents}Parent: pos={self.position},' \
+                     f'size={self.size}, level={self.level}\n'
+
+            for child in self.children:
+                result += str(child)
+
+            return result
+
+    def __eq__(self, other: Block) -> bool:
+        """Return True iff this Block and all its descendents are equivalent to
+        the <other> Block and all its descendents.
+        """
+        if len(self.children) == 0 and len(other.children) == 0:
+            # Both self and other are leaves.
+            return self.position == other.position and \
+                   self.size == other.size and \
+                   self.colour == other.colour and \
+                   self.level == other.level and \
+                   self.max_depth == other.max_depth
+        elif len(self.children) != len(other.children):
+            # One of self or other is a leaf while the other is not.
+            return False
+        else:
+            # Both self and other have four children.
+            for i in range(4):
+                # The != operator also uses the __eq__ special method.
+                if self.children[i] != other.children[i]:
+                    return False
+
+            return True
+
+    def _child_size(self) -> int:
+        """Return the size of this Block's children.
+        """
+        return round(self.size / 2.0)
+
+    def _children_positions(self) -> List[Tuple[int, int]]:
+        """Return the positions of this Block's four children.
+
+        The positions are returned in this order: upper-right child, upper-left
+        child, lower-left child, lower-right child.
+        """
+        x = self.position[0]
+        y = self.position[1]
+        size = self._child_size()
+
+        return [(x + size, y), (x, y), (x, y + size), (x + size, y + size)]
+
+    def _update_children_positions(self, position: Tuple[int, int]) -> None:
+        """Set the position of this Block to <position> and update all its
+        descendants to have positions consistent with this Block's.
+
+        <position> is the (x, y) coordinates of the upper-left corner of this
+        Block.
+        """
+        self.position = position
+
+        if len(self.children) == 4:
+            pos = self._children_positions()
+            for i in range(4):
+                self.children[i].position = pos[i]
+            for child in self.children:
+                if child.colour is None:
+                    child._update_children_positions(child.position)
+
+    def smashable(self) -> bool:
+        """Return True iff this block can be smashed.
+
+        A block can be smashed if it has no children and its level is not at
+        max_depth.
+        """
+        return self.level != self.max_depth and len(self.children) == 0
+
+    def _pick_color(self) -> None:
+        """
+        A private helper method for [smash].
+        Randomly pick a colour from the COLOUR_LIST in the settings.
+        """
+        random_int = random.randint(0, len(COLOUR_LIST) - 1)
+        colour = COLOUR_LIST[random_int]
+        self.colour = colour
+
+    def smash(self) -> bool:
+        """Sub-divide this block so that it has four randomly generated
+        children.
+
+        If this Block's level is <max_depth>, do nothing. If this block has
+        children, do nothing.
+
+        Return True iff the smash was performed.
+        """
+        if not self.smashable():
+            return False
+        self.colour = None
+        pos_lst = self._children_positions()
+        child_size = self._child_size()
+        child_level = self.level + 1
+        max_depth = self.max_depth
+        # common attributes for children. Only colours are different.
+        # use different random number to generate children
+        for i in range(4):
+            num = random.random()
+            colour = None
+            child = Block(pos_lst[i], child_size, colour, child_level,
+                          max_depth)
+            if num < math.exp(-0.25 * self.level):
+                if not child.smash():
+                    child._pick_color()
+            else:
+                child._pick_color()
+            self.children.append(child)
+        if self._registry is not None:
+            self._registry.smashed(self)
+        return True
+
+    def swap(self, direction: int) -> bool:
+        """Swap the child Blocks of this Block.
+
+        If this Block has no children, do nothing. Otherwise, if <direction> is
+        1, swap vertically. If <direction> is 0, swap horizontally.
+
+        Return True iff the swap was performed.
+
+        Precondition: <direction> is either 0 or 1
+        """
+        """if len(self.children) == 0:
+            return False
+        if direction == 0:
+            self.children[0], self.children[1] = self.children[1], \
+                                                 self.children[0]
+            self.children[2], self.children[3] = self.children[3], \
+                                                 self.children[2]
+        elif direction == 1:
+            self.children[0], self.children[3] = self.children[3], \
+                                                 self.children[0]
+            self.children[1], self.children[2] = self.children[2],\
+                                                 self.children[1]
+        self._update_children_positions(self.position)
+        return True
+        """
+
+        if len(self.children) == 0:
+            return False
+        pos = self._children_positions()
+        if direction == 1:
+            for i in range(4):
+                self.children[i]._update_children_positions(pos[3 - i])
+            self.children.reverse()
+        else:
+            copy = self.children[:]
+            for i in [0, 2]:  # i = 0 or i = 2
+                self.children[i]._update_children_positions(pos[i + 1])
+            self.children[0], self.children[2] = copy[1], copy[3]
+            for j in [1, 3]:  # i = 1 or i = 3
+                self.children[j]._update_children_positions(pos[j - 1])
+            self.children[1], self.children[3] = copy[0], copy[2]
+        return True
+
+    def rotate(self, direction: int) -> bool:
+        """Rotate this Block and all its descendants.
+
+        If this Block has no children, do nothing. If <direction> is 1, rotate
+        clockwise. If <direction> is 3, rotate counter-clockwise.
+
+        Return True iff the rotate was performed.
+
+        Precondition: <direction> is either 1 or 3.
+        """
+        if len(self.children) == 0:
+            return False
+        if direction == 1:
+            pos = self._children_positions()
+            pos.insert(0, pos.pop())  # [0,1,2,3] -> [3,0,1,2]
+            for i in range(4):
+                self.children[i]._update_children_positions(pos[i])
+                self.children[i].rotate(1)
+            self.children.append(self.children.pop(0))
+            return True
+        else:
+            pos = self._children_positions()
+            pos.append(pos.pop(0))
+            for j in range(4):
+                self.children[j]._update_children_positions(pos[j])
+                self.children[j].rotate(3)
+            self.children.insert(0, self.children.pop())
+            return True
+
+    def paint(self, colour: Tuple[int, int, int]) -> bool:
+        """Change this Block's colour iff it is a leaf at a level of max_depth
+        and its colour is different from <colour>.
+
+        Return True iff this Block's colour was changed.
+        """
+        if self.colour != colour and self.level == self.max_depth and \
+                len(self.children) == 0:
+            self.colour = colour
+            return True
+        else:
+            return False
+
+    def combine(self) -> bool:
+        """Turn this Block into a leaf based on the majority colour of its
+        children.
+
+        The majority colour is the colour with the most child blocks of that
+        colour. A tie does not constitute a majority (e.g., if there are two red
+        children and two blue children, then there is no majority colour).
+
+        If there is no majority colour, do nothing. If this block is not at a
+        level of max_depth - 1, or this block has no children, do nothing.
+
+        Return True iff this Block was turned into a leaf node.
+        """
+        if not self.combinable():
+            return False
+        else:
+            self.colour = self._majority_colour()
+            children = self.children
+            self.children = []
+            if self._registry is not None:
+                self._registry.combined(self, children)
+            return True
+
+    def _majority_colour(self) -> Optional[Tuple[int, int, int]]:
+        """A private helper method for [combine].
+        Return the colour with the most child blocks of that colour, or None
+        if there is no such colour or this block has no children.
+        """
+        if len(self.children) == 0:
+            return None
+        color_count = {}
+        for child in self.children:
+            colour = child.colour
+            if colour not in color_count:
+                color_count[colour] = 1
+            else:
+                color_count[colour] += 1
+        count = list(color_count.values())
+        colors = list(color_count.keys())
+        max_ = max(count)
+        if count.count(max_) != 1:
+            return None
+        else:
+            return colors[count.index(max_)]
+
+    def combinable(self) -> bool:
+        """Return True iff this block can be combined.
+
+        A block can be combined if it is at a level of max_depth - 1, it has
+        children, and its children have a majority colour.
+        """
+        return self.level == self.max_depth - 1 and \
+            self._majority_colour() is not None
+
+    def registry(self) -> NodeRegistry:
+        """Return the registry of the blocks in this board, building it if
+        it does not exist yet.
+
+        Once built, the registry is kept up to date by smash and combine.
+
+        Preconditions:
+            - This block is the root of its board.
+            - The children of blocks in this board are not assigned directly
+              after the registry is built.
+        """
+        if self._registry is None:
+            NodeRegistry(self)
+        return self._registry
+
+    def create_copy(self) -> Block:
+        """Return a new Block that is a deep copy of this Block.
+
+        Remember that a deep copy has new blocks (not aliases) at every level.
+        """
+        colour = self.colour
+        level = self.level
+        max_depth = self.max_depth
+        size = self.size
+        position = self.position
+        if not self.children:  # the block is a leaf
+            return Block(position, size, colour, level, max_depth)
+        else:
+            children = self.children[:]
+            block = Block(position, size, colour, level, max_depth)
+            for child in children:
+                block.children.append(child.create_copy())
+            return block
+
+
+class _BlockList:
+    """A list of blocks that supports adding, removing and choosing a random
+    block in constant time. The order of the blocks is not kept.
+    """
+    # === Private Attributes ===
+    # _blocks:
+    #   The blocks in this list.
+    # _index:
+    #   The index in <_blocks> of each block, keyed by its id.
+    _blocks: List[Block]
+    _index: Dict[int, int]
+
+    def __init__(self) -> None:
+        """Initialize an empty list of blocks.
+        """
+        self._blocks = []
+        self._index = {}
+
+    def __len__(self) -> int:
+        return len(self._blocks)
+
+    def __contains__(self, block: Block) -> bool:
+        return id(block) in self._index
+
+    def __getitem__(self, i: int) -> Block:
+        return self._blocks[i]
+
+    def add(self, block: Block) -> None:
+        """Add <block> to this list, if it is not in it already.
+        """
+        if id(block) not in self._index:
+            self._index[id(block)] = len(self._blocks)
+            self._blocks.append(block)
+
+    def remove(self, block: Block) -> None:
+        """Remove <block> from this list, if it is in it.
+        """
+        i = self._index.pop(id(block), None)
+        if i is not None:
+            last = self._blocks.pop()
+            if last is not block:
+                self._blocks[i] = last
+                self._index[id(last)] = i
+
+    def choice(self) -> Block:
+        """Return a block of this list chosen uniformly at random.
+
+        Precondition: len(self) > 0
+        """
+        return self._blocks[random.randrange(len(self._blocks))]
+
+
+class NodeRegistry:
+    """The blocks of one board, kept in lists by level.
+
+    A registry is built by Block.registry and kept up to date by the blocks of
+    its board when they are smashed or combined. Moving blocks around with
+    rotate and swap does not change which blocks are in the board.
+
+    === Public Attributes ===
+    max_depth:
+        The max_depth of the board.
+    """
+    max_depth: int
+    # === Private Attributes ===
+    # _nodes:
+    #   The blocks at each level.
+    # _leaves:
+    #   The blocks with no children at each level.
+    _nodes: List[_BlockList]
+    _leaves: List[_BlockList]
+
+    def __init__(self, board: Block) -> None:
+        """Initialize a registry of the blocks in <board> and attach it to
+        all of them.
+        """
+        self.max_depth = board.max_depth
+        self._nodes = [_BlockList() for _ in range(board.max_depth + 1)]
+        self._leaves = [_BlockList() for _ in range(board.max_depth + 1)]
+        self._add(board)
+
+    def _add(self, block: Block) -> None:
+        """Add <block> and its descendants to this registry.
+        """
+        block._registry = self
+        self._nodes[block.level].add(block)
+        if len(block.children) == 0:
+            self._leaves[block.level].add(block)
+        for child in block.children:
+            self._add(child)
+
+    def _remove(self, block: Block) -> None:
+        """Remove <block> and its descendants from this registry.
+        """
+        block._registry = None
+        self._nodes[block.level].remove(block)
+        self._leaves[block.level].remove(block)
+        for child in block.children:
+            self._remove(child)
+
+    def smashed(self, block: Block) -> None:
+        """Record that <block> has just been smashed.
+        """
+        self._leaves[block.level].remove(block)
+        for child in block.children:
+            self._add(child)
+
+    def combined(self, block: Block, children: List[Block]) -> None:
+        """Record that <block> has just been combined, and so no longer has
+        the given <children>.
+        """
+        for child in children:
+            self._remove(child)
+        self._leaves[block.level].add(block)
+
+    def node_count(self, level: int) -> int:
+        """Return the number of blocks at <level>.
+        """
+        return len(self._nodes[level])
+
+    def leaf_count(self, level: int) -> int:
+        """Return the number of blocks with no children at <level>.
+        """
+        return len(self._leaves[level])
+
+    def nodes(self, level: int) -> List[Block]:
+        """Return a new list of the blocks at <level>, in no particular order.
+        """
+        return [self._nodes[level][i] for i in range(len(self._nodes[level]))]
+
+    def leaves(self, level: int) -> List[Block]:
+        """Return a new list of the blocks with no children at <level>, in no
+        particular order.
+        """
+        return [self._leaves[level][i]
+                for i in range(len(self._leaves[level]))]
+
+    def random_block(self, distribution: str = 'area') -> Block:
+        """Return a random block of the board.
+
+        <distribution> is one of:
+            - 'node': every block is equally likely.
+            - 'leaf': every block with no children is equally likely.
+            - 'area': a level is chosen uniformly at random, then a point on
+              the board, and the block at that level covering the point is
+              returned. If the point is covered by a leaf above that level,
+              the leaf is returned instead. Larger blocks are more likely.
+
+        Only the number of blocks at each level is looked at, so the running
+        time does not depend on the number of blocks.
+        """
+        if distribution == 'node':
+            return _weighted_choice([(len(self._nodes[level]),
+                                      self._nodes[level])
+                                     for level in range(self.max_depth + 1)])
+        elif distribution == 'leaf':
+            return _weighted_choice([(len(self._leaves[level]),
+                                      self._leaves[level])
+                                     for level in range(self.max_depth + 1)])
+        elif distribution == 'area':
+            # A block at level l covers 4 ** (depth - l) of the 4 ** depth
+            # pieces the board is cut into at level <depth>.
+            depth = random.randint(0, self.max_depth)
+            choices = [(len(self._leaves[level]) * 4 ** (depth - level),
+                        self._leaves[level]) for level in range(depth)]
+            choices.append((len(self._nodes[depth]), self._nodes[depth]))
+            return _weighted_choice(choices)
+        else:
+            raise ValueError(f'Unknown distribution: {distribution}')
+
+
+def _weighted_choice(choices: List[Tuple[int, _BlockList]]) -> Block:
+    """Return a random block from one of the lists in <choices>, where each
+    list is paired with its weight. The list is chosen with probability
+    proportional to its weight, and the block uniformly from that list.
+
+    Precondition: the total weight is positive, and every list with a
+    positive weight is not empty.
+    """
+    r = random.randrange(sum(weight for weight, _ in choices))
+    i = 0
+    while r >= choices[i][0]:
+        r -= choices[i][0]
+        i += 1
+    return choices[i][1].choice()
+
+
+if __name__ == '__main__':
+    import python_ta
+
+    python_ta.check_all(config={
+        'allowed-import-modules': [
+            'doctest', 'python_ta', 'random', 'typing', '__future__', 'math',
+            'settings'
+        ],
+        'max-attributes': 15,
+        'max-args': 6
+    })
+
+    # This is a board consisting of only one block.
+    b1 = Block((0, 0), 750, COLOUR_LIST[0], 0, 1)
+    print("=== tiny board ===")
+    print(b1)
+
+    # Now let's make a random board.
+    b2 = generate_board(3, 750)
+    print("\n=== random board ===")
+    print(b2)
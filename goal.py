@@ -1,303 +1,604 @@
-"""CSC148 Assignment 2
-
-=== CSC148 Winter 2020 ===
-Department of Computer Science,
-University of Toronto
-
-This code is provided solely for the personal and private use of
-students taking the CSC148 course at the University of Toronto.
-Copying for purposes other than this use is expressly prohibited.
-All forms of distribution of this code, whether as given or with
-any changes, are expressly prohibited.
-
-Authors: Diane Horton, David Liu, Mario Badr, Sophia Huynh, Misha Schwartz,
-and Jaisie Sin
-
-All of the files in this directory and all subdirectories are:
-Copyright (c) Diane Horton, David Liu, Mario Badr, Sophia Huynh,
-Misha Schwartz, and Jaisie Sin
-
-=== Module Description ===
-
-This file contains the hierarchy of Goal classes.
-"""
-from __future__ import annotations
-import random
-from typing import List, Tuple
-from block import Block
-from settings import colour_name, COLOUR_LIST
-
-
-def _select_colour(copy: List) -> Tuple[int, int, int]:
-    """A private helper function of [generate_goals].
-    Randomly choose a colour in the COLOUR_LIST for the goal.
-    """
-    colour = random.choice(copy)
-    copy.remove(colour)
-    return colour
-
-
-def generate_goals(num_goals: int) -> List[Goal]:
-    """Return a randomly generated list of goals with length num_goals.
-
-    All elements of the list must be the same type of goal, but each goal
-    must have a different randomly generated colour from COLOUR_LIST. No two
-    goals can have the same colour.
-
-    Precondition:
-        - num_goals <= len(COLOUR_LIST)
-    """
-    i = 0
-    goal = []
-    goal_type = ['Perimeter', 'Blob']
-    colour_copy = COLOUR_LIST[:]
-    if random.choice(goal_type) == 'Perimeter':
-        while i < num_goals:
-            colour = _select_colour(colour_copy)
-            goal.append(PerimeterGoal(colour))
-            i += 1
-        return goal
-    else:
-        while i < num_goals:
-            colour = _select_colour(colour_copy)
-            goal.append(BlobGoal(colour))
-            i += 1
-        return goal
-
-
-def _combine(lst1: List[List], lst2: List[List]) -> List[List]:
-    """A helper function for [_flatten].
-    Return a nested list of combining every sublist of [lst1] and [lst2] at
-    the same index.
-    Precondition: len(lst1) == len(lst2)
-    """
-    lst = []
-    for i in range(len(lst1)):
-        lst.append(lst1[i] + lst2[i])
-    return lst
-
-
-def _flatten(block: Block) -> List[List[Tuple[int, int, int]]]:
-    """Return a two-dimensional list representing <block> as rows and columns of
-    unit cells.
-
-    Return a list of lists L, where,
-    for 0 <= i, j < 2^{max_depth - self.level}
-        - L[i] represents column i and
-        - L[i][j] represents the unit cell at column i and row j.
-
-    Each unit cell is represented by a tuple of 3 ints, which is the colour
-    of the block at the cell location[i][j]
-
-    L[0][0] represents the unit cell in the upper left corner of the Block.
-    """
-    grid = []
-    max_depth = block.max_depth
-    grid_size = 2 ** (max_depth - block.level)
-    if len(block.children) == 0:  # base case when the block has no children
-        i = 0
-        while i < grid_size:
-            column = []
-            j = 0
-            while j < grid_size:
-                column.append(block.colour)
-                j += 1
-            grid.append(column)
-            i += 1
-        return grid
-    else:
-        child_grid = []
-        children = block.children
-        for child in children:
-            child_grid.append(_flatten(child))
-        grid = _combine(child_grid[1], child_grid[2]) + _combine(child_grid[0],
-                                                                 child_grid[3])
-        return grid
-
-
-class Goal:
-    """A player goal in the game of Blocky.
-
-    This is an abstract class. Only child classes should be instantiated.
-
-    === Attributes ===
-    colour:
-        The target colour for this goal, that is the colour to which
-        this goal applies.
-    """
-    colour: Tuple[int, int, int]
-
-    def __init__(self, target_colour: Tuple[int, int, int]) -> None:
-        """Initialize this goal to have the given target colour.
-        """
-        self.colour = target_colour
-
-    def score(self, board: Block) -> int:
-        """Return the current score for this goal on the given board.
-
-        The score is always greater than or equal to 0.
-        """
-        raise NotImplementedError
-
-    def description(self) -> str:
-        """Return a description of this goal.
-        """
-        raise NotImplementedError
-
-
-class PerimeterGoal(Goal):
-    """A perimeter goal which is to put the most possible units of the target
-     colour on the outer perimeter of the board. The corner cells are counted
-     twice towards the score.
-
-    """
-    colour: Tuple[int, int, int]
-
-    def score(self, board: Block) -> int:
-        """Return the current score for the perimeter goal on the given board.
-        Non-corner unit cells are counted once towards the score and corner
-        unit cells are counted twice.
-
-        The score is greater than or equal to 0.
-
-        """
-        flatten = _flatten(board)
-        count = 0
-        if len(flatten) == 1:
-            return count + self._boundary_score(flatten[0])
-        if len(flatten) > 2:
-            for clm in flatten[1:-1]:
-                if clm[0] == self.colour:
-                    count += 1
-                if clm[-1] == self.colour:
-                    count += 1
-        return count + self._boundary_score(flatten[0]) + \
-            self._boundary_score(flatten[-1])
-
-    def _boundary_score(self, lst: List) -> int:
-        """A helper function of [score]. Calculate the score the player gets
-        on the boundary column [lst]. The first and the second items of the
-        column [lst] count twice towards the score.
-        """
-        score = 0
-        if lst[0] == self.colour:
-            score += 2
-        if lst[-1] == self.colour:
-            score += 2
-        if len(lst) > 2:
-            for colour in lst[1:-1]:
-                if colour == self.colour:
-                    score += 1
-        return score
-
-    def description(self) -> str:
-        """Return a string describing the rule of the perimeter goal and
-        the target colour of this goal.
-        """
-        return f"Perimeter goal! Put the most possible" \
-               f" {colour_name(self.colour)} units on the outer perimeter."
-
-
-class BlobGoal(Goal):
-    """A blob goal in the game of blocky.
-
-     A blob is a group of connected blocks with the same colour.
-     Two blocks are connected if their sides touch; touching corners does not
-     count.
-
-     The BlobGoal is to find the largest blob with the target colour.
-
-    """
-    colour: Tuple[int, int, int]
-
-    def score(self, board: Block) -> int:
-        """Return the current score for the blob goal on the given board.
-       The player’s score is the number of unit cells in the largest blob of
-       the target colour.
-
-       The score is greater than or equal to 0.
-       """
-        score = []
-        visited = []
-
-        j = 0
-        flatten = _flatten(board)
-        while j < len(flatten):
-            i = 0
-            minus_1 = []
-            while i < len(flatten):
-                minus_1.append(-1)
-                i += 1
-            visited.append(minus_1)
-            j += 1
-        # now we get the visited list
-
-        for c in range(len(flatten)):
-            for r in range(len(flatten)):
-                score.append(self._undiscovered_blob_size((c, r),
-                                                          flatten, visited))
-        return max(score)
-
-    def _undiscovered_blob_size(self, pos: Tuple[int, int],
-                                board: List[List[Tuple[int, int, int]]],
-                                visited: List[List[int]]) -> int:
-        """Return the size of the largest connected blob that (a) is of this
-        Goal's target colour, (b) includes the cell at <pos>, and (c) involves
-        only cells that have never been visited.
-
-        If <pos> is out of bounds for <board>, return 0.
-
-        <board> is the flattened board on which to search for the blob.
-        <visited> is a parallel structure that, in each cell, contains:
-            -1 if this cell has never been visited
-            0  if this cell has been visited and discovered
-               not to be of the target colour
-            1  if this cell has been visited and discovered
-               to be of the target colour
-
-        Update <visited> so that all cells that are visited are marked with
-        either 0 or 1.
-        """
-        clm = pos[0]
-        row = pos[1]
-        size = 1
-        if clm >= len(board) or row >= len(board) or clm < 0 or \
-                row < 0:
-            return 0
-        # the case when out of bounds
-
-        elif board[clm][row] != self.colour:
-            visited[clm][row] = 0
-            return 0
-        elif visited[clm][row] != -1:
-            return 0
-        else:
-            visited[clm][row] = 1
-            size += self._undiscovered_blob_size((clm + 1, row),
-                                                 board, visited)
-            size += self._undiscovered_blob_size((clm - 1, row),
-                                                 board, visited)
-            size += self._undiscovered_blob_size((clm, row + 1),
-                                                 board, visited)
-            size += self._undiscovered_blob_size((clm, row - 1),
-                                                 board, visited)
-            return size
-
-    def description(self) -> str:
-        """Return a string describing the rule of the blob goal and
-        the target colour of this goal.
-        """
-        return f"Blob goal! Your aim is to connect the largest " \
-               f"{colour_name(self.colour)} blocks."
-
-
-if __name__ == '__main__':
-    import python_ta
-
-    python_ta.check_all(config={
-        'allowed-import-modules': [
-            'doctest', 'python_ta', 'random', 'typing', 'block', 'settings',
-            'math', '__future__'
-        ],
-        'max-attributes': 15
-    })
+"""CSC148 Assignment 2
+
+=== CSC148 Winter 2020 ===
+Department of Computer Science,
+University of Toronto
+
+This code is provided solely for the personal and private use of
+students taking the CSC148 course at the University of Toronto.
+Copying for purposes other than this use is expressly prohibited.
+All forms of distribution of this code, whether as given or with
+any changes, are expressly prohibited.
+
+Authors: Diane Horton, David Liu, Mario Badr, Sophia Huynh, Misha Schwartz,
+and Jaisie Sin
+
+All of the files in this directory and all subdirectories are:
+Copyright (c) Diane Horton, David Liu, Mario Badr, Sophia Huynh,
+Misha Schwartz, and Jaisie Sin
+
+=== Module Description ===
+
+This file contains the hierarchy of Goal classes.
+"""
+from __future__ import annotations
+import random
+from typing import Dict, List, Optional, Set, Tuple
+from actions import ROTATE_CLOCKWISE, ROTATE_COUNTER_CLOCKWISE, \
+    SWAP_HORIZONTAL, SWAP_VERTICAL, SMASH, PAINT, COMBINE, PASS
+from block import Block
+from moves import apply_move, describe_move, locate_move
+from settings import colour_name, COLOUR_LIST
+
+
+def _select_colour(copy: List) -> Tuple[int, int, int]:
+    """A private helper function of [generate_goals].
+    Randomly choose a colour in the COLOUR_LIST for the goal.
+    """
+    colour = random.choice(copy)
+    copy.remove(colour)
+    return colour
+
+
+def generate_goals(num_goals: int) -> List[Goal]:
+    """Return a randomly generated list of goals with length num_goals.
+
+    All elements of the list must be the same type of goal, but each goal
+    must have a different randomly generated colour from COLOUR_LIST. No two
+    goals can have the same colour.
+
+    Precondition:
+        - num_goals <= len(COLOUR_LIST)
+    """
+    i = 0
+    goal = []
+    goal_type = ['Perimeter', 'Blob']
+    colour_copy = COLOUR_LIST[:]
+    if random.choice(goal_type) == 'Perimeter':
+        while i < num_goals:
+            colour = _select_colour(colour_copy)
+            goal.append(PerimeterGoal(colour))
+            i += 1
+        return goal
+    else:
+        while i < num_goals:
+            colour = _select_colour(colour_copy)
+            goal.append(BlobGoal(colour))
+            i += 1
+        return goal
+
+
+def _combine(lst1: List[List], lst2: List[List]) -> List[List]:
+    """A helper function for [_flatten].
+    Return a nested list of combining every sublist of [lst1] and [lst2] at
+    the same index.
+    Precondition: len(lst1) == len(lst2)
+    """
+    lst = []
+    for i in range(len(lst1)):
+        lst.append(lst1[i] + lst2[i])
+    return lst
+
+
+def _flatten(block: Block) -> List[List[Tuple[int, int, int]]]:
+    """Return a two-dimensional list representing <block> as rows and columns of
+    unit cells.
+
+    Return a list of lists L, where,
+    for 0 <= i, j < 2^{max_depth - self.level}
+        - L[i] represents column i and
+        - L[i][j] represents the unit cell at column i and row j.
+
+    Each unit cell is represented by a tuple of 3 ints, which is the colour
+    of the block at the cell location[i][j]
+
+    L[0][0] represents the unit cell in the upper left corner of the Block.
+    """
+    grid = []
+    max_depth = block.max_depth
+    grid_size = 2 ** (max_depth - block.level)
+    if len(block.children) == 0:  # base case when the block has no children
+        i = 0
+        while i < grid_size:
+            column = []
+            j = 0
+            while j < grid_size:
+                column.append(block.colour)
+                j += 1
+            grid.append(column)
+            i += 1
+        return grid
+    else:
+        child_grid = []
+        children = block.children
+        for child in children:
+            child_grid.append(_flatten(child))
+        grid = _combine(child_grid[1], child_grid[2]) + _combine(child_grid[0],
+                                                                 child_grid[3])
+        return grid
+
+
+def _cell_origin(board: Block, block: Block) -> Tuple[int, int]:
+    """Return the column and row of the unit cell in the upper left corner of
+    <block> within the flattened <board>.
+
+    Precondition: <block> is <board> or one of its descendants.
+    """
+    blocks_across = 2 ** block.level
+    cells = 2 ** (block.max_depth - block.level)
+    column = round((block.position[0] - board.position[0]) * blocks_across
+                   / board.size)
+    row = round((block.position[1] - board.position[1]) * blocks_across
+                / board.size)
+    return column * cells, row * cells
+
+
+def _block_cells(block: Block,
+                 grid: Optional[List[List[Tuple[int, int, int]]]] = None,
+                 origin: Tuple[int, int] = (0, 0)) -> \
+        List[List[Tuple[int, int, int]]]:
+    """Return the unit cells of <block>, in the format of _flatten.
+
+    If <grid> is given, it is the flattened board containing <block>, whose
+    upper left cell is at <origin> in <grid>, and the cells are taken from
+    it. Otherwise <block> is flattened.
+    """
+    if grid is None:
+        return _flatten(block)
+    n = 2 ** (block.max_depth - block.level)
+    return [column[origin[1]:origin[1] + n]
+            for column in grid[origin[0]:origin[0] + n]]
+
+
+def _moved_cells(block: Block, action: Tuple[str, Optional[int]],
+                 colour: Tuple[int, int, int],
+                 grid: Optional[List[List[Tuple[int, int, int]]]] = None,
+                 origin: Tuple[int, int] = (0, 0)) -> \
+        Optional[List[List[Tuple[int, int, int]]]]:
+    """Return the unit cells of <block>, in the format of _flatten, as they
+    would be after performing <action> on <block>, painting with <colour>.
+
+    <grid> and <origin> are as in _block_cells.
+
+    Return None if <action> can not be performed on <block>, or if its result
+    is random. This function does not mutate <block>.
+    """
+    n = 2 ** (block.max_depth - block.level)
+    cells = _block_cells(block, grid, origin)
+    half = n // 2
+
+    if action in [ROTATE_CLOCKWISE, ROTATE_COUNTER_CLOCKWISE,
+                  SWAP_HORIZONTAL, SWAP_VERTICAL] and len(block.children) == 0:
+        return None
+    elif action == ROTATE_CLOCKWISE:
+        return [[cells[r][n - 1 - c] for r in range(n)] for c in range(n)]
+    elif action == ROTATE_COUNTER_CLOCKWISE:
+        return [[cells[n - 1 - r][c] for r in range(n)] for c in range(n)]
+    elif action == SWAP_HORIZONTAL:
+        return cells[half:] + cells[:half]
+    elif action == SWAP_VERTICAL:
+        return [column[half:] + column[:half] for column in cells]
+    elif action == PAINT:
+        if block.level != block.max_depth or len(block.children) != 0 or \
+                block.colour == colour:
+            return None
+        return [[colour]]
+    elif action == COMBINE:
+        if not block.combinable():
+            return None
+        majority = block._majority_colour()
+        return [[majority] * n for _ in range(n)]
+    else:
+        return None
+
+
+class Goal:
+    """A player goal in the game of Blocky.
+
+    This is an abstract class. Only child classes should be instantiated.
+
+    === Attributes ===
+    colour:
+        The target colour for this goal, that is the colour to which
+        this goal applies.
+    """
+    colour: Tuple[int, int, int]
+
+    def __init__(self, target_colour: Tuple[int, int, int]) -> None:
+        """Initialize this goal to have the given target colour.
+        """
+        self.colour = target_colour
+
+    def score(self, board: Block) -> int:
+        """Return the current score for this goal on the given board.
+
+        The score is always greater than or equal to 0.
+        """
+        raise NotImplementedError
+
+    def score_delta(self, board: Block,
+                    move: Tuple[str, Optional[int], Block],
+                    grid: Optional[List[List[Tuple[int, int, int]]]] = None) \
+            -> int:
+        """Return how much the score for this goal on <board> would change if
+        <move> were made, painting with this goal's colour. Return 0 if
+        <move> can not be made.
+
+        <grid>, if given, must be _flatten(<board>). Callers that compute the
+        delta of many moves on the same board should pass the same <grid>
+        each time.
+
+        This implementation makes the move on a copy of <board> and scores
+        the copy. Subclasses may compute the delta from the part of the board
+        changed by <move> instead.
+
+        This function does not mutate <board>.
+        """
+        if (move[0], move[1]) == PASS:
+            return 0
+        copy = board.create_copy()
+        target = locate_move(copy, describe_move(move))
+        if target is None or \
+                not apply_move(target[2], (move[0], move[1]), self.colour):
+            return 0
+        return self.score(copy) - self.score(board)
+
+    def description(self) -> str:
+        """Return a description of this goal.
+        """
+        raise NotImplementedError
+
+
+class PerimeterGoal(Goal):
+    """A perimeter goal which is to put the most possible units of the target
+     colour on the outer perimeter of the board. The corner cells are counted
+     twice towards the score.
+
+    """
+    colour: Tuple[int, int, int]
+
+    def score(self, board: Block) -> int:
+        """Return the current score for the perimeter goal on the given board.
+        Non-corner unit cells are counted once towards the score and corner
+        unit cells are counted twice.
+
+        The score is greater than or equal to 0.
+
+        """
+        flatten = _flatten(board)
+        count = 0
+        if len(flatten) == 1:
+            return count + self._boundary_score(flatten[0])
+        if len(flatten) > 2:
+            for clm in flatten[1:-1]:
+                if clm[0] == self.colour:
+                    count += 1
+                if clm[-1] == self.colour:
+                    count += 1
+        return count + self._boundary_score(flatten[0]) + \
+            self._boundary_score(flatten[-1])
+
+    def _boundary_score(self, lst: List) -> int:
+        """A helper function of [score]. Calculate the score the player gets
+        on the boundary column [lst]. The first and the second items of the
+        column [lst] count twice towards the score.
+        """
+        score = 0
+        if lst[0] == self.colour:
+            score += 2
+        if lst[-1] == self.colour:
+            score += 2
+        if len(lst) > 2:
+            for colour in lst[1:-1]:
+                if colour == self.colour:
+                    score += 1
+        return score
+
+    def score_delta(self, board: Block,
+                    move: Tuple[str, Optional[int], Block],
+                    grid: Optional[List[List[Tuple[int, int, int]]]] = None) \
+            -> int:
+        """Return how much the score for this goal on <board> would change if
+        <move> were made. Return 0 if <move> can not be made.
+
+        Only the unit cells of the moved block that lie on the perimeter of
+        <board> are looked at. Smashes are scored on a copy of <board>,
+        because their outcome is random.
+
+        This function does not mutate <board>.
+        """
+        block = move[2]
+        action = (move[0], move[1])
+        n = 2 ** (block.max_depth - block.level)
+        size = 2 ** block.max_depth
+        x, y = _cell_origin(board, block)
+        if action == PASS or \
+                (0 < x and x + n < size and 0 < y and y + n < size):
+            # No unit cell on the perimeter can change.
+            return 0
+
+        after = _moved_cells(block, action, self.colour, grid, (x, y))
+        if after is None:
+            if action == SMASH and block.smashable():
+                return Goal.score_delta(self, board, move, grid)
+            return 0
+        before = _block_cells(block, grid, (x, y))
+        return self._cells_score(after, x, y, size) - \
+            self._cells_score(before, x, y, size)
+
+    def _cells_score(self, cells: List[List[Tuple[int, int, int]]],
+                     x: int, y: int, size: int) -> int:
+        """A helper function of [score_delta]. Return the score contributed by
+        <cells>, whose upper left cell is at column <x> and row <y> of a board
+        that is <size> unit cells across.
+        """
+        score = 0
+        last = size - 1
+        for i in range(len(cells)):
+            for j in range(len(cells)):
+                if cells[i][j] == self.colour:
+                    c = x + i
+                    r = y + j
+                    score += (c == 0) + (c == last) + (r == 0) + (r == last)
+        return score
+
+    def description(self) -> str:
+        """Return a string describing the rule of the perimeter goal and
+        the target colour of this goal.
+        """
+        return f"Perimeter goal! Put the most possible" \
+               f" {colour_name(self.colour)} units on the outer perimeter."
+
+
+class BlobGoal(Goal):
+    """A blob goal in the game of blocky.
+
+     A blob is a group of connected blocks with the same colour.
+     Two blocks are connected if their sides touch; touching corners does not
+     count.
+
+     The BlobGoal is to find the largest blob with the target colour.
+
+    """
+    colour: Tuple[int, int, int]
+    # === Private Attributes ===
+    # _grid:
+    #   The flattened board most recently passed to score_delta, or None.
+    # _labels:
+    #   For each unit cell of <_grid>, the index of the blob it belongs to, or
+    #   -1 if it is not of the target colour.
+    # _sizes:
+    #   The number of unit cells in each blob of <_grid>.
+    _grid: Optional[List[List[Tuple[int, int, int]]]]
+    _labels: List[List[int]]
+    _sizes: List[int]
+
+    def __init__(self, target_colour: Tuple[int, int, int]) -> None:
+        """Initialize this goal to have the given target colour.
+        """
+        Goal.__init__(self, target_colour)
+        self._grid = None
+        self._labels = []
+        self._sizes = []
+
+    def __getstate__(self) -> Dict[str, object]:
+        """Return the state of this goal to be pickled, leaving out the blobs
+        remembered by score_delta.
+        """
+        return {'colour': self.colour}
+
+    def __setstate__(self, state: Dict[str, object]) -> None:
+        """Restore this goal from a state returned by __getstate__.
+        """
+        self.__init__(state['colour'])
+
+    def score(self, board: Block) -> int:
+        """Return the current score for the blob goal on the given board.
+       The player’s score is the number of unit cells in the largest blob of
+       the target colour.
+
+       The score is greater than or equal to 0.
+       """
+        score = []
+        visited = []
+
+        j = 0
+        flatten = _flatten(board)
+        while j < len(flatten):
+            i = 0
+            minus_1 = []
+            while i < len(flatten):
+                minus_1.append(-1)
+                i += 1
+            visited.append(minus_1)
+            j += 1
+        # now we get the visited list
+
+        for c in range(len(flatten)):
+            for r in range(len(flatten)):
+                score.append(self._undiscovered_blob_size((c, r),
+                                                          flatten, visited))
+        return max(score)
+
+    def _undiscovered_blob_size(self, pos: Tuple[int, int],
+                                board: List[List[Tuple[int, int, int]]],
+                                visited: List[List[int]]) -> int:
+        """Return the size of the largest connected blob that (a) is of this
+        Goal's target colour, (b) includes the cell at <pos>, and (c) involves
+        only cells that have never been visited.
+
+        If <pos> is out of bounds for <board>, return 0.
+
+        <board> is the flattened board on which to search for the blob.
+        <visited> is a parallel structure that, in each cell, contains:
+            -1 if this cell has never been visited
+            0  if this cell has been visited and discovered
+               not to be of the target colour
+            1  if this cell has been visited and discovered
+               to be of the target colour
+
+        Update <visited> so that all cells that are visited are marked with
+        either 0 or 1.
+        """
+        clm = pos[0]
+        row = pos[1]
+        size = 1
+        if clm >= len(board) or row >= len(board) or clm < 0 or \
+                row < 0:
+            return 0
+        # the case when out of bounds
+
+        elif board[clm][row] != self.colour:
+            visited[clm][row] = 0
+            return 0
+        elif visited[clm][row] != -1:
+            return 0
+        else:
+            visited[clm][row] = 1
+            size += self._undiscovered_blob_size((clm + 1, row),
+                                                 board, visited)
+            size += self._undiscovered_blob_size((clm - 1, row),
+                                                 board, visited)
+            size += self._undiscovered_blob_size((clm, row + 1),
+                                                 board, visited)
+            size += self._undiscovered_blob_size((clm, row - 1),
+                                                 board, visited)
+            return size
+
+    def _label_blobs(self, grid: List[List[Tuple[int, int, int]]]) -> None:
+        """A helper function of [score_delta]. Find the blobs of the target
+        colour in <grid> and remember them, unless <grid> is the flattened
+        board whose blobs are already remembered.
+        """
+        if grid is self._grid:
+            return
+        size = len(grid)
+        labels = [[-1] * size for _ in range(size)]
+        sizes = []
+        for c in range(size):
+            for r in range(size):
+                if grid[c][r] == self.colour and labels[c][r] == -1:
+                    label = len(sizes)
+                    labels[c][r] = label
+                    stack = [(c, r)]
+                    count = 0
+                    while stack:
+                        i, j = stack.pop()
+                        count += 1
+                        for a, b in ((i + 1, j), (i - 1, j), (i, j + 1),
+                                     (i, j - 1)):
+                            if 0 <= a < size and 0 <= b < size and \
+                                    labels[a][b] == -1 and \
+                                    grid[a][b] == self.colour:
+                                labels[a][b] = label
+                                stack.append((a, b))
+                    sizes.append(count)
+        self._grid = grid
+        self._labels = labels
+        self._sizes = sizes
+
+    def score_delta(self, board: Block,
+                    move: Tuple[str, Optional[int], Block],
+                    grid: Optional[List[List[Tuple[int, int, int]]]] = None) \
+            -> int:
+        """Return how much the score for this goal on <board> would change if
+        <move> were made. Return 0 if <move> can not be made.
+
+        Only the blobs that touch the moved block are measured again; the
+        other blobs keep the size they have on <board>. The blobs of <grid>
+        are remembered between calls, so passing the same <grid> for every
+        move on a board finds them only once. Smashes are scored on a copy of
+        <board>, because their outcome is random.
+
+        This function does not mutate <board>.
+        """
+        block = move[2]
+        action = (move[0], move[1])
+        if action == PASS:
+            return 0
+        if grid is None:
+            grid = _flatten(board)
+        x, y = _cell_origin(board, block)
+        after = _moved_cells(block, action, self.colour, grid, (x, y))
+        if after is None:
+            if action == SMASH and block.smashable():
+                return Goal.score_delta(self, board, move, grid)
+            return 0
+
+        self._label_blobs(grid)
+        size = len(grid)
+        n = len(after)
+        left, right = max(0, x - 1), min(size, x + n + 1)
+        top, bottom = max(0, y - 1), min(size, y + n + 1)
+
+        # Blobs in or next to the moved block may change; the others do not.
+        touched = set()
+        for c in range(left, right):
+            for r in range(top, bottom):
+                touched.add(self._labels[c][r])
+        best = 0
+        for label in range(len(self._sizes)):
+            if label not in touched:
+                best = max(best, self._sizes[label])
+
+        visited = set()
+        for c in range(left, right):
+            for r in range(top, bottom):
+                best = max(best, self._blob_after((c, r), grid, after,
+                                                  (x, y), visited))
+        return best - max(self._sizes, default=0)
+
+    def _blob_after(self, pos: Tuple[int, int],
+                    grid: List[List[Tuple[int, int, int]]],
+                    after: List[List[Tuple[int, int, int]]],
+                    origin: Tuple[int, int],
+                    visited: Set[Tuple[int, int]]) -> int:
+        """A helper function of [score_delta]. Return the size of the blob
+        that includes <pos> and no cell in <visited>, on the board <grid>
+        whose cells starting at <origin> have been replaced by <after>.
+
+        Add the cells of the blob to <visited>.
+        """
+        size = len(grid)
+        n = len(after)
+
+        def colour_at(i: int, j: int) -> Tuple[int, int, int]:
+            if origin[0] <= i < origin[0] + n and \
+                    origin[1] <= j < origin[1] + n:
+                return after[i - origin[0]][j - origin[1]]
+            return grid[i][j]
+
+        if pos in visited or colour_at(*pos) != self.colour:
+            return 0
+        visited.add(pos)
+        stack = [pos]
+        count = 0
+        while stack:
+            i, j = stack.pop()
+            count += 1
+            for a, b in ((i + 1, j), (i - 1, j), (i, j + 1), (i, j - 1)):
+                if 0 <= a < size and 0 <= b < size and \
+                        (a, b) not in visited and \
+                        colour_at(a, b) == self.colour:
+                    visited.add((a, b))
+                    stack.append((a, b))
+        return count
+
+    def description(self) -> str:
+        """Return a string describing the rule of the blob goal and
+        the target colour of this goal.
+        """
+        return f"Blob goal! Your aim is to connect the largest " \
+               f"{colour_name(self.colour)} blocks."
+
+
+if __name__ == '__main__':
+    import python_ta
+
+    python_ta.check_all(config={
+        'allowed-import-modules': [
+            'doctest', 'python_ta', 'random', 'typing', 'block', 'settings',
+            'math', '__future__', 'actions', 'moves'
+        ],
+        'max-attributes': 15
+    })
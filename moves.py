@@ -0,0 +1,120 @@
+"""CSC148 Assignment 2
+
+=== CSC148 Winter 2020 ===
+Department of Computer Science,
+University of Toronto
+
+This code is provided solely for the personal and private use of
+students taking the CSC148 course at the University of Toronto.
+Copying for purposes other than this use is expressly prohibited.
+All forms of distribution of this code, whether as given or with
+any changes, are expressly prohibited.
+
+Authors: Diane Horton, David Liu, Mario Badr, Sophia Huynh, Misha Schwartz,
+and Jaisie Sin
+
+All of the files in this directory and all subdirectories are:
+Copyright (c) Diane Horton, David Liu, Mario Badr, Sophia Huynh,
+Misha Schwartz, and Jaisie Sin.
+
+=== Module Description ===
+
+This file contains helper functions for performing moves on a Block without
+going through the game states. A move is a tuple consisting of the name of the
+action, an optional direction and the block the action is performed on.
+"""
+from __future__ import annotations
+from typing import List, Optional, Tuple
+
+from actions import ROTATE_CLOCKWISE, ROTATE_COUNTER_CLOCKWISE, \
+    SWAP_HORIZONTAL, SWAP_VERTICAL, SMASH, PASS, PAINT, COMBINE
+from block import Block
+
+
+def apply_move(block: Block, action: Tuple[str, Optional[int]],
+               colour: Tuple[int, int, int]) -> bool:
+    """Perform <action> on <block>, painting with <colour> if <action> is
+    PAINT.
+
+    Return True iff the action was successfully performed. Passing is always
+    successful.
+    """
+    direction = action[1]
+    if action in [ROTATE_CLOCKWISE, ROTATE_COUNTER_CLOCKWISE]:
+        return block.rotate(direction)
+    elif action in [SWAP_HORIZONTAL, SWAP_VERTICAL]:
+        return block.swap(direction)
+    elif action == SMASH:
+        return block.smash()
+    elif action == PAINT:
+        return block.paint(colour)
+    elif action == COMBINE:
+        return block.combine()
+    else:
+        return action == PASS
+
+
+def legal_moves(board: Block, colour: Tuple[int, int, int]) -> \
+        List[Tuple[str, Optional[int], Block]]:
+    """Return every move other than PASS that can be successfully performed
+    on <board> or one of its descendants, painting with <colour>.
+
+    Blocks are visited parent first, and children in the order they are
+    stored.
+    """
+    moves = []
+    if len(board.children) == 4:
+        for action in [ROTATE_CLOCKWISE, ROTATE_COUNTER_CLOCKWISE,
+                       SWAP_HORIZONTAL, SWAP_VERTICAL]:
+            moves.append((action[0], action[1], board))
+        if board.combinable():
+            moves.append((COMBINE[0], COMBINE[1], board))
+        for child in board.children:
+            moves.extend(legal_moves(child, colour))
+    elif board.smashable():
+        moves.append((SMASH[0], SMASH[1], board))
+    elif board.level == board.max_depth and board.colour != colour:
+        moves.append((PAINT[0], PAINT[1], board))
+    return moves
+
+
+def describe_move(move: Tuple[str, Optional[int], Block]) -> \
+        Tuple[str, Optional[int], Tuple[int, int], int]:
+    """Return a description of <move> that does not refer to any particular
+    Block object: the name of the action, its direction, and the position
+    and level of the block the action is performed on.
+    """
+    return move[0], move[1], move[2].position, move[2].level
+
+
+def locate_move(board: Block,
+                description: Tuple[str, Optional[int], Tuple[int, int], int]) \
+        -> Optional[Tuple[str, Optional[int], Block]]:
+    """Return the move on <board> that matches <description>, as returned by
+    describe_move, or None if <board> has no block at the described position
+    and level.
+    """
+    name, direction, position, level = description
+    block = board
+    while block.level < level and len(block.children) == 4:
+        for child in block.children:
+            x, y = child.position
+            if x <= position[0] < x + child.size and \
+                    y <= position[1] < y + child.size:
+                block = child
+                break
+        else:
+            return None
+    if block.level != level or block.position != position:
+        return None
+    return name, direction, block
+
+
+if __name__ == '__main__':
+    import python_ta
+
+    python_ta.check_all(config={
+        'allowed-import-modules': [
+            'doctest', 'python_ta', 'typing', 'actions', 'block', '__future__'
+        ]
+    })
@@ -0,0 +1,310 @@
+"""CSC148 Assignment 2
+
+=== CSC148 Winter 2020 ===
+Department of Computer Science,
+University of Toronto
+
+This code is provided solely for the personal and private use of
+students taking the CSC148 course at the University of Toronto.
+Copying for purposes other than this use is expressly prohibited.
+All forms of distribution of this code, whether as given or with
+any changes, are expressly prohibited.
+
+Authors: Diane Horton, David Liu, Mario Badr, Sophia Huynh, Misha Schwartz,
+and Jaisie Sin
+
+All of the files in this directory and all subdirectories are:
+Copyright (c) Diane Horton, David Liu, Mario Badr, Sophia Huynh,
+Misha Schwartz, and Jaisie Sin.
+
+=== Module Description ===
+
+This file contains a beam-search planner that looks several moves ahead for a
+single player, and a player that follows its plans.
+"""
+from __future__ import annotations
+from typing import Dict, List, Optional, Tuple, Union
+import heapq
+import multiprocessing
+import time
+import pygame
+
+from actions import ACTION_PENALTY, PASS, SMASH
+from block import Block
+from goal import Goal, _flatten
+from moves import apply_move, describe_move, legal_moves, locate_move
+from player import Player, _create_move
+from symmetry import canonical_key
+from transposition import position_key
+
+
+def _board_key(board: Block, goal: Goal, symmetric: bool) -> \
+        Union[int, str]:
+    """Return the key used to recognise <board> when it is reached again.
+
+    If <symmetric> is True, boards that are rotations or reflections of each
+    other have the same key.
+    """
+    if symmetric:
+        return canonical_key(board)
+    return position_key(board, goal)
+
+
+def _expand(board: Block, goal: Goal, symmetric: bool) -> \
+        List[Tuple[Tuple[str, Optional[int], Tuple[int, int], int], int, int,
+                   Union[int, str]]]:
+    """Return the result of every legal move on <board> other than SMASH.
+
+    Each result is a tuple of the move's description, its penalty, the score
+    for <goal> after the move, and the key of the board after the move, as
+    returned by _board_key. Smashes are left out because their outcome is
+    random.
+
+    This function does not mutate <board>.
+    """
+    results = []
+    grid = _flatten(board)
+    score = goal.score(board)
+    for move in legal_moves(board, goal.colour):
+        action = (move[0], move[1])
+        if action == SMASH:
+            continue
+        description = describe_move(move)
+        delta = goal.score_delta(board, move, grid)
+        copy = board.create_copy()
+        target = locate_move(copy, description)[2]
+        apply_move(target, action, goal.colour)
+        results.append((description, ACTION_PENALTY[action], score + delta,
+                        _board_key(copy, goal, symmetric)))
+    return results
+
+
+class BeamPlanner:
+    """A planner that searches for the sequence of moves that gives a single
+    player the best score, minus penalties, within a number of moves.
+
+    At each step, the planner keeps the <width> best boards it has reached and
+    expands each of them with all legal moves. Boards that have been reached
+    before are only kept once. If <symmetric> is True, a board is also dropped
+    when it is a rotation or reflection of a board reached before, which is
+    safe for goals that score such boards equally.
+
+    === Public Attributes ===
+    goal:
+        The goal the planner is trying to achieve.
+    width:
+        The number of boards kept after each step.
+    horizon:
+        The largest number of moves in a plan.
+    processes:
+        The number of processes used to expand boards.
+    symmetric:
+        True iff boards are recognised up to rotation and reflection.
+    boards_expanded:
+        The number of boards the planner has expanded.
+    boards_scored:
+        The number of boards the planner has reached and scored.
+    duplicates:
+        The number of boards that were dropped for having been reached before.
+    seconds:
+        The total time spent planning, in seconds.
+
+    === Representation Invariants ===
+    - width >= 1
+    - horizon >= 1
+    - processes >= 1
+    """
+    goal: Goal
+    width: int
+    horizon: int
+    processes: int
+    symmetric: bool
+    boards_expanded: int
+    boards_scored: int
+    duplicates: int
+    seconds: float
+    # === Private Attributes ===
+    # _pool:
+    #   The worker processes used when <processes> > 1, or None if they have
+    #   not been started.
+    _pool: Optional[multiprocessing.pool.Pool]
+
+    def __init__(self, goal: Goal, width: int, horizon: int,
+                 processes: int = 1, symmetric: bool = False) -> None:
+        """Initialize this planner.
+
+        Precondition: width >= 1 and horizon >= 1 and processes >= 1
+        """
+        self.goal = goal
+        self.width = width
+        self.horizon = horizon
+        self.processes = processes
+        self.symmetric = symmetric
+        self.boards_expanded = 0
+        self.boards_scored = 0
+        self.duplicates = 0
+        self.seconds = 0.0
+        self._pool = None
+
+    def __enter__(self) -> BeamPlanner:
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Stop the worker processes of this planner, if any.
+        """
+        if self._pool is not None:
+            self._pool.close()
+            self._pool.join()
+            self._pool = None
+
+    def _expand_all(self, boards: List[Block]) -> \
+            List[List[Tuple[Tuple[str, Optional[int], Tuple[int, int], int],
+                            int, int, Union[int, str]]]]:
+        """Return the results of _expand for each of <boards>, in order.
+        """
+        args = [(board, self.goal, self.symmetric) for board in boards]
+        if self.processes == 1 or len(boards) == 1:
+            return [_expand(*arg) for arg in args]
+        if self._pool is None:
+            self._pool = multiprocessing.Pool(self.processes)
+        return self._pool.starmap(_expand, args)
+
+    def plan(self, board: Block) -> \
+            List[Tuple[str, Optional[int], Tuple[int, int], int]]:
+        """Return the descriptions of the moves, in order, that give the best
+        score minus penalties on <board> within <horizon> moves.
+
+        The descriptions can be turned back into moves with moves.locate_move.
+        An empty list means that no plan is better than passing.
+
+        This function does not mutate <board>.
+        """
+        start = time.perf_counter()
+        best_value = self.goal.score(board)
+        best_plan = []
+        seen = {_board_key(board, self.goal, self.symmetric)}
+        # Each beam entry is a board, the plan reaching it and its penalty.
+        beam = [(board, [], 0)]
+
+        for _ in range(self.horizon):
+            results = self._expand_all([entry[0] for entry in beam])
+            self.boards_expanded += len(beam)
+            candidates = []
+            for i in range(len(beam)):
+                for description, penalty, score, key in results[i]:
+                    self.boards_scored += 1
+                    if key in seen:
+                        self.duplicates += 1
+                        continue
+                    seen.add(key)
+                    total = penalty + beam[i][2]
+                    candidates.append((score - total, -len(candidates), i,
+                                       description, total))
+            if len(candidates) == 0:
+                break
+
+            new_beam = []
+            for value, _, i, description, penalty in \
+                    heapq.nlargest(self.width, candidates):
+                copy = beam[i][0].create_copy()
+                move = locate_move(copy, description)
+                apply_move(move[2], (move[0], move[1]), self.goal.colour)
+                moves = beam[i][1] + [description]
+                new_beam.append((copy, moves, penalty))
+                if value > best_value:
+                    best_value, best_plan = value, moves
+            beam = new_beam
+
+        self.seconds += time.perf_counter() - start
+        return best_plan
+
+    def throughput(self) -> float:
+        """Return the number of boards scored per second of planning, or 0.0
+        if this planner has not planned yet.
+        """
+        if self.seconds == 0:
+            return 0.0
+        return self.boards_scored / self.seconds
+
+    def statistics(self) -> Dict[str, Union[int, float]]:
+        """Return a summary of the work this planner has done.
+        """
+        return {
+            'boards_expanded': self.boards_expanded,
+            'boards_scored': self.boards_scored,
+            'duplicates': self.duplicates,
+            'seconds': self.seconds,
+            'boards_per_second': self.throughput()
+        }
+
+
+class BeamPlayer(Player):
+    """A player that makes the first move of the plan found by a BeamPlanner,
+    planning again before each move.
+
+    === Private Attributes ===
+    _proceed:
+      True when the player should make a move, False when the player should
+      wait.
+    _planner:
+      The planner used to choose this player's moves.
+    """
+    _proceed: bool
+    _planner: BeamPlanner
+
+    def __init__(self, player_id: int, goal: Goal, width: int, horizon: int,
+                 processes: int = 1) -> None:
+        """Initialize this BeamPlayer with the given <player_id> and <goal>,
+        planning with the given beam <width>, <horizon> and number of
+        <processes>.
+
+        Precondition: width >= 1 and horizon >= 1 and processes >= 1
+        """
+        Player.__init__(self, player_id, goal)
+        self._proceed = False
+        self._planner = BeamPlanner(goal, width, horizon, processes)
+
+    def get_selected_block(self, board: Block) -> Optional[Block]:
+        """No block should be selected manually by the beam player.
+        Return None always.
+        """
+        return None
+
+    def process_event(self, event: pygame.event.Event) -> None:
+        """Update this player based on the pygame event.
+        """
+        if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+            self._proceed = True
+
+    def generate_move(self, board: Block) -> \
+            Optional[Tuple[str, Optional[int], Block]]:
+        """Return the first move of the best plan on <board>, or PASS if no
+        plan is better than passing.
+
+        This function does not mutate <board>.
+        """
+        if not self._proceed:
+            return None  # Do not remove
+
+        self._proceed = False
+        plan = self._planner.plan(board)
+        if len(plan) == 0:
+            return _create_move(PASS, board)
+        return locate_move(board, plan[0])
+
+
+if __name__ == '__main__':
+    import python_ta
+
+    python_ta.check_all(config={
+        'allowed-import-modules': [
+            'doctest', 'python_ta', 'typing', 'actions', 'block', 'goal',
+            'heapq', 'moves', 'multiprocessing', 'player', 'pygame', 'time',
+            'symmetry', 'transposition', '__future__'
+        ],
+        'max-attributes': 10,
+        'generated-members': 'pygame.*'
+    })
@@ -0,0 +1,185 @@
+"""CSC148 Assignment 2
+
+=== CSC148 Winter 2020 ===
+Department of Computer Science,
+University of Toronto
+
+This code is provided solely for the personal and private use of
+students taking the CSC148 course at the University of Toronto.
+Copying for purposes other than this use is expressly prohibited.
+All forms of distribution of this code, whether as given or with
+any changes, are expressly prohibited.
+
+Authors: Diane Horton, David Liu, Mario Badr, Sophia Huynh, Misha Schwartz,
+and Jaisie Sin
+
+All of the files in this directory and all subdirectories are:
+Copyright (c) Diane Horton, David Liu, Mario Badr, Sophia Huynh,
+Misha Schwartz, and Jaisie Sin.
+
+=== Module Description ===
+
+This file contains functions for recognising boards that are rotations or
+reflections of each other.
+
+PerimeterGoal and BlobGoal give the same score to a board and to any of its 8
+images under the symmetries of a square, so a player only needs to score one
+board of each such group. The symmetries are numbered as follows, and each
+maps the point (x, y) of the unit square to:
+
+    0: (x, y)          identity
+    1: (1 - y, x)      rotate clockwise
+    2: (1 - x, 1 - y)  rotate 180 degrees
+    3: (y, 1 - x)      rotate counter-clockwise
+    4: (1 - x, y)      reflect left to right
+    5: (x, 1 - y)      reflect top to bottom
+    6: (y, x)          reflect along the main diagonal
+    7: (1 - y, 1 - x)  reflect along the other diagonal
+"""
+from __future__ import annotations
+from typing import Dict, List, Optional, Tuple
+
+from block import Block
+from settings import COLOUR_LIST
+
+NUM_SYMMETRIES = 8
+
+# The quadrant (x, y) of each child index: upper-right, upper-left,
+# lower-left, lower-right.
+_QUADRANTS = [(1, 0), (0, 0), (0, 1), (1, 1)]
+
+# The default number of subtrees remembered by a cache of images.
+DEFAULT_CACHE_SIZE = 100000
+
+
+def transform_point(t: int, x: int, y: int, n: int) -> Tuple[int, int]:
+    """Return the cell that cell (<x>, <y>) of an <n> by <n> grid is moved to
+    by symmetry <t>.
+
+    >>> transform_point(1, 0, 0, 4)
+    (3, 0)
+    >>> transform_point(6, 2, 0, 4)
+    (0, 2)
+    """
+    m = n - 1
+    return [(x, y), (m - y, x), (m - x, m - y), (y, m - x),
+            (m - x, y), (x, m - y), (y, x), (m - y, m - x)][t]
+
+
+def inverse(t: int) -> int:
+    """Return the symmetry that undoes symmetry <t>.
+
+    >>> inverse(1)
+    3
+    >>> inverse(6)
+    6
+    """
+    return [0, 3, 2, 1, 4, 5, 6, 7][t]
+
+
+def _build_sources() -> List[List[int]]:
+    """Return, for each symmetry t and each child index i, the index of the
+    child that symmetry t moves into the place of child i.
+    """
+    sources = []
+    for t in range(NUM_SYMMETRIES):
+        row = []
+        for x, y in _QUADRANTS:
+            row.append(_QUADRANTS.index(transform_point(inverse(t), x, y, 2)))
+        sources.append(row)
+    return sources
+
+
+_SOURCES = _build_sources()
+
+
+def _leaf_code(colour: Tuple[int, int, int]) -> str:
+    """Return the code of a leaf with the given <colour>.
+    """
+    if colour in COLOUR_LIST:
+        return str(COLOUR_LIST.index(colour))
+    return '<' + ','.join(str(c) for c in colour) + '>'
+
+
+def _codes(block: Block, codes: Dict[int, str]) -> str:
+    """Return the code of <block> and record the code of <block> and each of
+    its descendants in <codes>, keyed by their id.
+
+    The code of a leaf is the code of its colour, and the code of a block with
+    children is the codes of its children, in order, between parentheses.
+    """
+    if len(block.children) == 0:
+        code = _leaf_code(block.colour)
+    else:
+        code = '(' + ''.join(_codes(child, codes)
+                             for child in block.children) + ')'
+    codes[id(block)] = code
+    return code
+
+
+def _images(block: Block, codes: Dict[int, str],
+            cache: Dict[str, List[str]]) -> List[str]:
+    """Return the codes of the 8 images of <block>, indexed by symmetry.
+
+    The images of a block are built from the images of its children, and the
+    images of every block are remembered in <cache> under the block's own
+    code, so that a subtree that is unchanged since the last call is not
+    visited again.
+    """
+    code = codes[id(block)]
+    if code in cache:
+        return cache[code]
+    if len(block.children) == 0:
+        images = [code] * NUM_SYMMETRIES
+    else:
+        children = [_images(child, codes, cache) for child in block.children]
+        images = [code]
+        for t in range(1, NUM_SYMMETRIES):
+            images.append('(' + ''.join(children[i][t]
+                                        for i in _SOURCES[t]) + ')')
+    cache[code] = images
+    return images
+
+
+def canonical_form(board: Block,
+                   cache: Optional[Dict[str, List[str]]] = None) -> \
+        Tuple[str, int]:
+    """Return the canonical code of <board> and the symmetry that maps
+    <board> onto the board with that code.
+
+    Two boards have the same canonical code iff one of them is a rotation or
+    reflection of the other. If several symmetries give the canonical code,
+    the smallest one is returned.
+
+    <cache> remembers the images of subtrees between calls. Passing the same
+    dictionary when canonicalizing boards that differ by a few moves means
+    only the changed parts of each board are transformed. The cache is
+    emptied once it holds DEFAULT_CACHE_SIZE subtrees.
+    """
+    if cache is None:
+        cache = {}
+    elif len(cache) > DEFAULT_CACHE_SIZE:
+        cache.clear()
+    codes = {}
+    _codes(board, codes)
+    images = _images(board, codes, cache)
+    best = min(images)
+    return best, images.index(best)
+
+
+def canonical_key(board: Block,
+                  cache: Optional[Dict[str, List[str]]] = None) -> str:
+    """Return the canonical code of <board>, as returned by canonical_form.
+    """
+    return canonical_form(board, cache)[0]
+
+
+if __name__ == '__main__':
+    import python_ta
+
+    python_ta.check_all(config={
+        'allowed-import-modules': [
+            'doctest', 'python_ta', 'typing', 'block', 'settings',
+            '__future__'
+        ]
+    })
@@ -0,0 +1,242 @@
+"""CSC148 Assignment 2
+
+=== CSC148 Winter 2020 ===
+Department of Computer Science,
+University of Toronto
+
+This code is provided solely for the personal and private use of
+students taking the CSC148 course at the University of Toronto.
+Copying for purposes other than this use is expressly prohibited.
+All forms of distribution of this code, whether as given or with
+any changes, are expressly prohibited.
+
+Authors: Diane Horton, David Liu, Mario Badr, Sophia Huynh, Misha Schwartz,
+and Jaisie Sin
+
+All of the files in this directory and all subdirectories are:
+Copyright (c) Diane Horton, David Liu, Mario Badr, Sophia Huynh,
+Misha Schwartz, and Jaisie Sin.
+
+=== Module Description ===
+
+This file contains the transposition table that search players use to avoid
+scoring the same board more than once.
+"""
+from __future__ import annotations
+from typing import Dict, List, Optional, Tuple, Union
+
+from block import Block
+from goal import Goal
+
+# The approximate number of bytes used by one stored entry, including the
+# entry object, its key and the move description it refers to.
+ENTRY_SIZE = 240
+
+# The default memory limit of a table, in bytes.
+DEFAULT_MEMORY_LIMIT = 16 * 1024 * 1024
+
+
+def board_key(board: Block) -> Tuple:
+    """Return a hashable value that is equal for two boards iff they have the
+    same structure and the same colours.
+
+    The key of a leaf is its colour, and the key of a block with children is
+    the tuple of the keys of its children.
+
+    >>> b1 = Block((0, 0), 750, (1, 128, 181), 0, 1)
+    >>> b2 = Block((0, 0), 750, (1, 128, 181), 0, 1)
+    >>> board_key(b1) == board_key(b2)
+    True
+    """
+    if len(board.children) == 0:
+        return board.colour
+    return tuple(board_key(child) for child in board.children)
+
+
+def position_key(board: Block, goal: Goal) -> int:
+    """Return the key under which the score of <board> for <goal> is stored
+    in a TranspositionTable.
+    """
+    return hash((type(goal).__name__, goal.colour, board.max_depth,
+                 board_key(board)))
+
+
+class TableEntry:
+    """A position stored in a TranspositionTable.
+
+    === Public Attributes ===
+    key:
+        The position key of the stored board.
+    score:
+        The score of the stored board for the goal it was searched with.
+    move:
+        A description of the best move found on the stored board, as returned
+        by moves.describe_move, or None if only the board's score is known.
+    depth:
+        The number of moves that were searched ahead of the stored board.
+    """
+    key: int
+    score: int
+    move: Optional[Tuple[str, Optional[int], Tuple[int, int], int]]
+    depth: int
+
+    def __init__(self, key: int, score: int,
+                 move: Optional[Tuple[str, Optional[int], Tuple[int, int],
+                                      int]],
+                 depth: int) -> None:
+        """Initialize this entry.
+        """
+        self.key = key
+        self.score = score
+        self.move = move
+        self.depth = depth
+
+
+class TranspositionTable:
+    """A table of searched positions with a bounded amount of memory.
+
+    The table is made up of buckets, each holding two entries. The first
+    entry of a bucket is only replaced by an entry searched at least as
+    deeply, and the second entry is always replaced. An entry pushed out of
+    the first slot moves into the second one.
+
+    One table can be shared by several players, as long as their positions
+    are stored with position_key.
+
+    === Public Attributes ===
+    lookups:
+        The number of calls to lookup.
+    hits:
+        The number of calls to lookup that found a usable entry.
+    stores:
+        The number of calls to store.
+    overwrites:
+        The number of stored entries that were pushed out of the table by
+        another position.
+    """
+    lookups: int
+    hits: int
+    stores: int
+    overwrites: int
+    # === Private Attributes ===
+    # _deep:
+    #   The depth-preferred slot of each bucket.
+    # _recent:
+    #   The always-replace slot of each bucket.
+    _deep: List[Optional[TableEntry]]
+    _recent: List[Optional[TableEntry]]
+
+    def __init__(self, memory_limit: int = DEFAULT_MEMORY_LIMIT) -> None:
+        """Initialize an empty table that uses about <memory_limit> bytes
+        when it is full.
+
+        Precondition: memory_limit > 0
+        """
+        buckets = max(1, memory_limit // (2 * ENTRY_SIZE))
+        self._deep = [None] * buckets
+        self._recent = [None] * buckets
+        self.lookups = 0
+        self.hits = 0
+        self.stores = 0
+        self.overwrites = 0
+
+    def __len__(self) -> int:
+        """Return the number of entries in this table.
+        """
+        return sum(1 for entry in self._deep if entry is not None) + \
+            sum(1 for entry in self._recent if entry is not None)
+
+    def capacity(self) -> int:
+        """Return the largest number of entries this table can hold.
+        """
+        return 2 * len(self._deep)
+
+    def lookup(self, key: int, depth: int = 0) -> Optional[TableEntry]:
+        """Return the entry stored under <key> if it was searched at least
+        <depth> moves ahead, or None if there is no such entry.
+        """
+        self.lookups += 1
+        i = key % len(self._deep)
+        for entry in (self._deep[i], self._recent[i]):
+            if entry is not None and entry.key == key and entry.depth >= depth:
+                self.hits += 1
+                return entry
+        return None
+
+    def store(self, key: int, score: int,
+              move: Optional[Tuple[str, Optional[int], Tuple[int, int], int]],
+              depth: int) -> None:
+        """Store the <score>, best <move> and search <depth> of the position
+        with the given <key>.
+        """
+        self.stores += 1
+        i = key % len(self._deep)
+        entry = TableEntry(key, score, move, depth)
+        deep = self._deep[i]
+        recent = self._recent[i]
+
+        if recent is not None and recent.key == key:
+            # Never keep two entries for one position.
+            self._recent[i] = None
+            recent = None
+
+        if deep is not None and deep.key == key and depth < deep.depth:
+            # Keep the deeper result for this position.
+            return
+        if deep is None or deep.key == key or depth >= deep.depth:
+            self._deep[i] = entry
+            if deep is not None and deep.key != key:
+                self._push_recent(i, deep, recent)
+        else:
+            self._push_recent(i, entry, recent)
+
+    def _push_recent(self, i: int, entry: TableEntry,
+                     recent: Optional[TableEntry]) -> None:
+        """Put <entry> in the always-replace slot of bucket <i>, which
+        currently holds <recent>.
+        """
+        if recent is not None:
+            self.overwrites += 1
+        self._recent[i] = entry
+
+    def hit_rate(self) -> float:
+        """Return the fraction of lookups that found a usable entry, or 0.0 if
+        there have been no lookups.
+        """
+        if self.lookups == 0:
+            return 0.0
+        return self.hits / self.lookups
+
+    def statistics(self) -> Dict[str, Union[int, float]]:
+        """Return a summary of how this table has been used.
+        """
+        return {
+            'entries': len(self),
+            'capacity': self.capacity(),
+            'lookups': self.lookups,
+            'hits': self.hits,
+            'hit_rate': self.hit_rate(),
+            'stores': self.stores,
+            'overwrites': self.overwrites
+        }
+
+    def clear(self) -> None:
+        """Remove all entries and reset the statistics of this table.
+        """
+        buckets = len(self._deep)
+        self._deep = [None] * buckets
+        self._recent = [None] * buckets
+        self.lookups = 0
+        self.hits = 0
+        self.stores = 0
+        self.overwrites = 0
+
+
+if __name__ == '__main__':
+    import python_ta
+
+    python_ta.check_all(config={
+        'allowed-import-modules': [
+            'doctest', 'python_ta', 'typing', 'block', 'goal', '__future__'
+        ]
+    })